@@ -22,14 +22,16 @@ def format_zensus2011(census_path: str, grid_path: str, nuts_shape_path: str, nu
     admin = gpd.read_file(nuts_shape_path)[["NUTS_ID", "geometry"]]
     mask = admin[admin["NUTS_ID"].isin(nuts)]
     # Read census data
-    census = pd.read_csv(census_path, sep=";").set_index("Gitter_ID_100m")
+    census = pd.read_csv(
+        census_path, sep=";", usecols=["Gitter_ID_100m", "Einwohner"], dtype={"Gitter_ID_100m": str, "Einwohner": "int32"}
+    ).set_index("Gitter_ID_100m")
     # Read geo data of census
-    grid = gpd.read_file(grid_path, mask=mask)[['id', 'geometry']]
+    grid = gpd.read_file(grid_path, mask=mask, engine="pyogrio", columns=["id"])
     grid = grid.set_index("id")
     # Combine information
-    grid['population'] = census['Einwohner']
+    grid['population'] = grid.index.map(census['Einwohner'])
     # Process
-    grid["population"] = grid["population"].apply(lambda x: 0 if x < 0 else x).fillna(0)
+    grid["population"] = grid["population"].fillna(0).clip(lower=0).astype("int32")
     # Add type
     grid["type"] = "CensusEntry"
     # Save